@@ -15,8 +15,7 @@ from sciencebeam_utils.utils.collection import (
 from sciencebeam_utils.beam_utils.utils import (
     TransformAndCount,
     TransformAndLog,
-    MapOrLog,
-    PreventFusion
+    MapOrLog
 )
 
 from sciencebeam_utils.beam_utils.io import (
@@ -141,7 +140,7 @@ def configure_pipeline(p, opt, pipeline, config):
     input_urls = (
         p |
         beam.Create(file_list) |
-        PreventFusion()
+        "Reshuffle" >> beam.Reshuffle()
     )
 
     input_data = (
@@ -1,5 +1,5 @@
 import logging
-from typing import List  # pylint: disable=unused-import
+from typing import IO, List, Union  # pylint: disable=unused-import
 
 from sciencebeam.pipelines import PipelineStep  # pylint: disable=unused-import
 from sciencebeam.pipelines import (
@@ -33,7 +33,7 @@ class SimplePipelineRunner:
         }
 
     def convert(
-            self, content: str, filename: str, data_type: str,
+            self, content: Union[bytes, str, IO[bytes]], filename: str, data_type: str,
             includes=None,
             context: dict = None) -> dict:
         current_item = {
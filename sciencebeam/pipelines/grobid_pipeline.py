@@ -9,7 +9,9 @@ from sciencebeam.transformers.xslt import xslt_transformer_from_file
 
 from sciencebeam.utils.mime_type_constants import MimeTypes
 
-from . import Pipeline, FunctionPipelineStep, FieldNames, StepDataProps
+from . import (
+    Pipeline, FunctionPipelineStep, RequestsPipelineStep, FieldNames, StepDataProps
+)
 
 DEFAULT_GROBID_ACTION = GrobidApiPaths.PROCESS_HEADER_DOCUMENT
 DEFAULT_GROBID_XSLT_PATH = 'xslt/grobid-jats.xsl'
@@ -76,20 +78,22 @@ class GrobidPipeline(Pipeline):
             grobid_url, args.grobid_action, start_service=start_grobid_service
         )
 
-        def convert_to_tei(pdf_filename, pdf_content, includes):
+        def convert_to_tei(pdf_filename, pdf_content, includes, context):
             return call_grobid(  # pylint: disable=redundant-keyword-arg
                 (pdf_filename, pdf_content),
                 path=args.grobid_action or get_default_grobid_action_for_fields(
                     includes
-                )
+                ),
+                session=(context or {}).get(RequestsPipelineStep.REQUESTS_SESSION_KEY)
             )[1]
 
         steps = [
-            FunctionPipelineStep(lambda data, **_: {
+            FunctionPipelineStep(lambda data, context=None, **_: {
                 StepDataProps.CONTENT: convert_to_tei(
                     pdf_filename=data[StepDataProps.FILENAME],
                     pdf_content=data[StepDataProps.CONTENT],
-                    includes=data.get(StepDataProps.INCLUDES)
+                    includes=data.get(StepDataProps.INCLUDES),
+                    context=context
                 ),
                 StepDataProps.TYPE: MimeTypes.TEI_XML
             }, {MimeTypes.PDF}, 'Convert to TEI')
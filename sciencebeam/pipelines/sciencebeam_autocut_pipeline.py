@@ -26,13 +26,26 @@ class ScienceBeamAutocutApiStep(RequestsPipelineStep):
     def __init__(self, api_url, xpath):
         super().__init__(api_url=api_url)
         self._xpath = xpath
+        # compile (and thereby validate) the xpath once, rather than per request
+        self._compiled_xpath = etree.XPath(xpath)
+
+    def __getstate__(self):
+        # The compiled xpath cannot be pickled and will be compiled lazily
+        state = self.__dict__.copy()
+        state['_compiled_xpath'] = None
+        return state
+
+    def _get_compiled_xpath(self) -> etree.XPath:
+        if self._compiled_xpath is None:
+            self._compiled_xpath = etree.XPath(self._xpath)
+        return self._compiled_xpath
 
     def get_supported_types(self):
         return {MimeTypes.JATS_XML, MimeTypes.TEI_XML, MimeTypes.XML}
 
     def process_request(self, data: dict, session: requests.Session, context: dict = None):
         root = etree.fromstring(data['content'])
-        matching_nodes = root.xpath(self._xpath)
+        matching_nodes = self._get_compiled_xpath()(root)
         if not matching_nodes:
             LOGGER.info('xpath not matching any element: %s', self._xpath)
             return data
@@ -1,12 +1,18 @@
 import logging
 import mimetypes
+import os
+from typing import IO
 
+import requests
 from flask import Blueprint, jsonify, request, Response, url_for
 from werkzeug.exceptions import BadRequest
 
 from sciencebeam_utils.utils.collection import strip_all
 
 from sciencebeam.utils.mime_type_constants import MimeTypes
+from sciencebeam.utils.requests import configure_session_pool
+
+from sciencebeam.pipelines import RequestsPipelineStep
 
 from sciencebeam.pipeline_runners.simple_pipeline_runner import (
     create_simple_pipeline_runner_from_config,
@@ -17,6 +23,14 @@ LOGGER = logging.getLogger(__name__)
 
 DEFAULT_FILENAME = 'file'
 
+# types whose pipeline steps accept a file-like content (rather than bytes),
+# uploaded files of these types are passed on as a stream without reading them
+STREAMABLE_TYPES = frozenset({MimeTypes.PDF})
+
+XML_RESPONSE_TYPES = frozenset({MimeTypes.TEI_XML, MimeTypes.JATS_XML})
+
+INLINE_RESPONSE_TYPES = frozenset({'text/xml', MimeTypes.PDF})
+
 
 def add_arguments(parser, config, argv=None):
     _add_arguments(parser, config, argv=argv)
@@ -26,13 +40,25 @@ def parse_includes(includes):
     return includes and set(strip_all(includes.split(',')))
 
 
+def get_remaining_stream_size(stream: IO[bytes]) -> int:
+    position = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell() - position
+    stream.seek(position)
+    return size
+
+
 def create_api_blueprint(config, args):
     blueprint = Blueprint('api', __name__)
 
     pipeline_runner = create_simple_pipeline_runner_from_config(
         config, args
     )
-    supported_types = pipeline_runner.get_supported_types()
+    supported_types = frozenset(pipeline_runner.get_supported_types())
+
+    # share one session (and its connection pool) across requests
+    session = requests.Session()
+    configure_session_pool(session=session)
 
     @blueprint.route("/")
     def _api_root():
@@ -50,6 +76,7 @@ def create_api_blueprint(config, args):
             data_type = request.mimetype
             filename = request.args.get('filename')
             content = request.data
+            content_size = len(content)
         elif 'file' not in request.files:
             raise BadRequest(
                 'missing file named "file", found: %s ' % request.files.keys()
@@ -58,9 +85,10 @@ def create_api_blueprint(config, args):
             uploaded_file = request.files['file']
             data_type = uploaded_file.mimetype
             filename = uploaded_file.filename
-            content = uploaded_file.read()
+            content = uploaded_file.stream
+            content_size = get_remaining_stream_size(content)
 
-        if not content:
+        if not content_size:
             raise BadRequest('no contents')
 
         if not filename:
@@ -81,12 +109,16 @@ def create_api_blueprint(config, args):
             LOGGER.info('%s (filename: %s)', error_message, filename)
             raise BadRequest(error_message)
 
+        if not isinstance(content, bytes) and data_type not in STREAMABLE_TYPES:
+            content = content.read()
+
         LOGGER.debug(
             'processing file: %s (%d bytes, type "%s")',
-            filename, len(content), data_type
+            filename, content_size, data_type
         )
         context = {
-            'request_args': request.args
+            'request_args': request.args,
+            RequestsPipelineStep.REQUESTS_SESSION_KEY: session
         }
         conversion_result = pipeline_runner.convert(
             content=content, filename=filename, data_type=data_type,
@@ -99,12 +131,12 @@ def create_api_blueprint(config, args):
             'response_content: %s (%s)',
             len(response_content), response_type
         )
-        if response_type in {MimeTypes.TEI_XML, MimeTypes.JATS_XML}:
+        if response_type in XML_RESPONSE_TYPES:
             response_type = 'text/xml'
         filename = conversion_result.get('filename')
         LOGGER.debug('output filename: %s', filename)
         headers = None
-        if filename and response_type not in {'text/xml', MimeTypes.PDF}:
+        if filename and response_type not in INLINE_RESPONSE_TYPES:
             headers = {
                 'Content-Disposition': 'attachment; filename=%s' % filename
             }
@@ -29,20 +29,24 @@ def start_service_if_not_running():
     service_wrapper.start_service_if_not_running()
 
 
-def run_grobid_service(item, base_url, path, start_service=True, field_name=None):
+def run_grobid_service(
+        item, base_url, path, start_service=True, field_name=None,
+        session: requests.Session = None):
     """
     Translates PDF content via the GROBID service.
 
     Args:
       item: one of:
         * tuple (filename, pdf content)
-        * pdf content
+        * pdf content (bytes or a file-like object)
         * field content (requires field name)
       base_url: base url to the GROBID service
       path: path of the GROBID endpoint
       start_service: if true, a GROBID service will be started automatically and
         kept running until the application ends
       field_name: the field name the field content relates to
+      session: the requests session to use (allowing connections to be reused),
+        a new connection is made for every call if not provided
 
     Returns:
       If item is tuple:
@@ -56,19 +60,25 @@ def run_grobid_service(item, base_url, path, start_service=True, field_name=None
     if start_service:
         start_service_if_not_running()
 
+    post = session.post if session is not None else requests.post
+
     if field_name:
         content = item
-        response = requests.post(
+        response = post(
             url,
             data={field_name: content}
         )
     else:
         filename = item[0] if isinstance(item, tuple) else 'unknown.pdf'
         content = item[1] if isinstance(item, tuple) else item
-        get_logger().info('processing: %s (%d) - %s', filename, len(content), url)
-        response = requests.post(
+        if isinstance(content, bytes):
+            get_logger().info('processing: %s (%d) - %s', filename, len(content), url)
+            content = BytesIO(content)
+        else:
+            get_logger().info('processing: %s (stream) - %s', filename, url)
+        response = post(
             url,
-            files={'input': (filename, BytesIO(content))},
+            files={'input': (filename, content)},
             data={
                 'consolidateHeader': '0',
                 'consolidateCitations': '0'
@@ -99,7 +99,7 @@ class GrobidServiceWrapper:
                     )
 
     def start_service_if_not_running(self):
-        get_logger().info('grobid_service_instance: %s', self.grobid_service_instance)
+        get_logger().debug('grobid_service_instance: %s', self.grobid_service_instance)
         if self.grobid_service_instance is None:
             self.unzip_grobid_service_zip_if_target_directory_does_not_exist()
             grobid_service_home = os.path.abspath(
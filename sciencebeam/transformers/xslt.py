@@ -1,5 +1,6 @@
+import hashlib
 import logging
-from typing import Union
+from typing import Dict, Tuple, Union
 
 from lxml import etree
 from lxml.etree import Element, ElementTree
@@ -11,12 +12,45 @@ LOGGER = logging.getLogger(__name__)
 T_XSLT_Input = Union[Element, ElementTree]
 
 
+# compiled XSLT stylesheets by their base url and the sha256 hash of their
+# serialized content, shared by all transformer instances within the process
+# (e.g. multiple pipelines or unpickled copies using the same stylesheet)
+_COMPILED_XSLT_BY_HASH: Dict[Tuple[str, str], etree.XSLT] = {}
+
+
+def _get_xslt_template_hash(xslt_template: Union[bytes, str]) -> str:
+    if isinstance(xslt_template, str):
+        xslt_template = xslt_template.encode('utf-8')
+    return hashlib.sha256(xslt_template).hexdigest()
+
+
+def _get_or_compile_xslt(
+        xslt_template: Union[bytes, str],
+        xslt_root: T_XSLT_Input = None,
+        base_url: str = None) -> etree.XSLT:
+    # the base url determines how relative includes and imports are resolved
+    cache_key = (base_url, _get_xslt_template_hash(xslt_template))
+    transform = _COMPILED_XSLT_BY_HASH.get(cache_key)
+    if transform is None:
+        if xslt_root is None:
+            xslt_root = etree.fromstring(xslt_template, base_url=base_url)
+        transform = etree.XSLT(xslt_root)
+        _COMPILED_XSLT_BY_HASH[cache_key] = transform
+    return transform
+
+
 def _to_xslt_input(value: Union[bytes, str, T_XSLT_Input]) -> T_XSLT_Input:
     if isinstance(value, (bytes, str)):
         return etree.fromstring(value)
     return value
 
 
+def _get_base_url(xslt_root: T_XSLT_Input) -> str:
+    if isinstance(xslt_root, etree._ElementTree):  # pylint: disable=protected-access
+        return xslt_root.docinfo.URL
+    return xslt_root.getroottree().docinfo.URL
+
+
 def _transform_string_or_dom(transform):
     return lambda x: transform(_to_xslt_input(x))
 
@@ -27,25 +61,45 @@ def _format_output(root, to_string, pretty_print=True):
 
 def xslt_transformer_from_file(xslt_filename, *args, **kwargs):
     return xslt_transformer_from_string(
-        etree.tostring(etree.parse(xslt_filename)),
+        etree.parse(xslt_filename),
         *args, **kwargs
     )
 
 
 class xslt_transformer_from_string:
-    def __init__(self, xslt_template, to_string=True, pretty_print=False):
-        self.xslt_template = xslt_template
+    def __init__(
+            self, xslt_template: Union[bytes, str, T_XSLT_Input],
+            to_string=True, pretty_print=False):
+        xslt_root = _to_xslt_input(xslt_template)
+        # keep the serialized stylesheet around, so that we can be pickled
+        # (along with its base url, to resolve relative includes and imports)
+        self.xslt_template = (
+            xslt_template if isinstance(xslt_template, (bytes, str))
+            else etree.tostring(xslt_root)
+        )
+        self.xslt_base_url = (
+            None if isinstance(xslt_template, (bytes, str))
+            else _get_base_url(xslt_root)
+        )
         self.to_string = to_string
         self.pretty_print = pretty_print
-        self.__transform = None
-        # validate the XSLT stylesheet
-        etree.fromstring(self.xslt_template)
+        # compile (and thereby validate) the XSLT stylesheet once, up front,
+        # so that the first transformation doesn't pay for it
+        self.__transform = _get_or_compile_xslt(
+            self.xslt_template, xslt_root, base_url=self.xslt_base_url
+        )
+
+    def __getstate__(self):
+        # The transform function cannot be pickled and will be loaded lazily
+        state = self.__dict__.copy()
+        state['_xslt_transformer_from_string__transform'] = None
+        return state
 
     def _get_transform(self):
         if self.__transform is None:
-            # The transform function cannot be pickled and needs to be loaded lazily
-            transform = etree.XSLT(etree.fromstring(self.xslt_template))
-            self.__transform = transform
+            self.__transform = _get_or_compile_xslt(
+                self.xslt_template, base_url=self.xslt_base_url
+            )
         return self.__transform
 
     def __call__(self, x):
@@ -15,6 +15,8 @@ METHOD_WHITELIST_WITH_POST = frozenset(
 
 DEFAULT_STATUS_FORCELIST = (500, 502, 503, 504,)
 
+DEFAULT_POOL_MAXSIZE = 32
+
 
 def configure_session_retry(
         session=None,
@@ -38,6 +40,15 @@ def configure_session_retry(
     session.mount('https://', requests.adapters.HTTPAdapter(max_retries=retry, **kwargs))
 
 
+def configure_session_pool(
+        session=None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        **kwargs):
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_maxsize, **kwargs)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+
 @contextmanager
 def RetrySession(**kwargs):
     with requests.Session() as session:
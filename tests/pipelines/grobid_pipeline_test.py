@@ -9,7 +9,7 @@ from sciencebeam_utils.utils.collection import extend_dict
 
 from sciencebeam.utils.mime_type_constants import MimeTypes
 
-from sciencebeam.pipelines import FieldNames, StepDataProps
+from sciencebeam.pipelines import FieldNames, StepDataProps, RequestsPipelineStep
 from sciencebeam.pipelines import grobid_pipeline as grobid_pipeline_module
 from sciencebeam.pipelines.grobid_pipeline import (
     PIPELINE,
@@ -60,11 +60,11 @@ def _args():
     return MagicMock(name='args')
 
 
-def _run_pipeline(config, args, pdf_input):
+def _run_pipeline(config, args, pdf_input, context=None):
     parser = argparse.ArgumentParser()
     PIPELINE.add_arguments(parser, config)
     steps = PIPELINE.get_steps(config, args)
-    return reduce(lambda value, step: step(value), steps, pdf_input)
+    return reduce(lambda value, step: step(value, context=context), steps, pdf_input)
 
 
 class TestGrobidPipeline:
@@ -93,7 +93,21 @@ class TestGrobidPipeline:
         _run_pipeline(config, args, PDF_INPUT)
         grobid_service_instance.assert_called_with(
             (PDF_INPUT['filename'], PDF_INPUT['content']),
-            path=args.grobid_action
+            path=args.grobid_action,
+            session=None
+        )
+
+    def test_should_pass_requests_session_from_context_to_grobid_service_instance(
+            self, config, args, grobid_service_instance):
+
+        session = MagicMock(name='session')
+        _run_pipeline(config, args, PDF_INPUT, context={
+            RequestsPipelineStep.REQUESTS_SESSION_KEY: session
+        })
+        grobid_service_instance.assert_called_with(
+            (PDF_INPUT['filename'], PDF_INPUT['content']),
+            path=args.grobid_action,
+            session=session
         )
 
     def test_should_use_process_header_if_includes_only_contains_header(
@@ -105,7 +119,8 @@ class TestGrobidPipeline:
         }))
         grobid_service_instance.assert_called_with(
             (PDF_INPUT['filename'], PDF_INPUT['content']),
-            path=GrobidApiPaths.PROCESS_HEADER_DOCUMENT
+            path=GrobidApiPaths.PROCESS_HEADER_DOCUMENT,
+            session=None
         )
 
     def test_should_use_process_full_text_if_includes_only_contains_references(
@@ -117,7 +132,8 @@ class TestGrobidPipeline:
         }))
         grobid_service_instance.assert_called_with(
             (PDF_INPUT['filename'], PDF_INPUT['content']),
-            path=GrobidApiPaths.PROCESS_FULL_TEXT_DOCUMENT
+            path=GrobidApiPaths.PROCESS_FULL_TEXT_DOCUMENT,
+            session=None
         )
 
     def test_should_return_tei_content_as_xml_content_without_xslt(
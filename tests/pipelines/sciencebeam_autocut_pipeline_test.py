@@ -1,4 +1,5 @@
 import argparse
+import pickle
 from functools import reduce  # pylint: disable=W0622
 
 from mock import patch, MagicMock
@@ -135,3 +136,18 @@ class TestScienceBeamAutocutPipeline:
             {'other': 'other1'}
         ))
         assert result['other'] == 'other1'
+
+    def test_should_return_xml_with_updated_title_after_pickling_step(
+            self, config, args, response):
+
+        response.text = TITLE_2
+
+        steps = [
+            pickle.loads(pickle.dumps(step))
+            for step in PIPELINE.get_steps(config, args)
+        ]
+        result = reduce(
+            lambda value, step: step(value), steps,
+            _generate_content_with_title(TITLE_1)
+        )
+        assert result['content'] == _generate_xml_with_title(TITLE_2)
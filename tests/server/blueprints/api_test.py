@@ -6,6 +6,7 @@ import json
 from io import BytesIO
 from mock import patch, MagicMock, ANY
 
+import requests
 from flask import Flask
 from werkzeug.exceptions import BadRequest
 
@@ -29,6 +30,9 @@ PDF_FILENAME = 'test.pdf'
 PDF_CONTENT = b'eat pdf for breakfast'
 XML_CONTENT = b'<article></article>'
 
+DOCX_FILENAME = 'test.docx'
+DOCX_CONTENT = b'docx content'
+
 
 @contextmanager
 def _api_test_client(config, args):
@@ -134,18 +138,54 @@ class TestApiBlueprint:
                     'content': XML_CONTENT,
                     'type': MimeTypes.JATS_XML
                 }
+                received_content = []
+
+                def _convert(content, **_):
+                    # the uploaded file is passed as a stream, only readable during the request
+                    received_content.append(content.read())
+                    return pipeline_runner.convert.return_value
+
+                pipeline_runner.convert.side_effect = _convert
                 response = test_client.post('/convert', data=dict(
                     file=(BytesIO(PDF_CONTENT), PDF_FILENAME),
                 ))
-                expected_context = {'request_args': {}}
+                expected_context = {'request_args': {}, 'requests_session': ANY}
                 pipeline_runner.convert.assert_called_with(
-                    content=PDF_CONTENT, filename=PDF_FILENAME, data_type=MimeTypes.PDF,
+                    content=ANY, filename=PDF_FILENAME, data_type=MimeTypes.PDF,
                     includes=None,
                     context=expected_context
                 )
+                assert received_content == [PDF_CONTENT]
                 assert response.status_code == 200
                 assert response.data == XML_CONTENT
 
+        def test_should_read_non_pdf_file_and_pass_bytes_to_convert_method(
+                self, config, args, pipeline_runner):
+            pipeline_runner.get_supported_types.return_value = {
+                MimeTypes.PDF, MimeTypes.DOCX
+            }
+            with _api_test_client(config, args) as test_client:
+                pipeline_runner.convert.return_value = {
+                    'content': XML_CONTENT,
+                    'type': MimeTypes.JATS_XML
+                }
+                response = test_client.post('/convert', data=dict(
+                    file=(BytesIO(DOCX_CONTENT), DOCX_FILENAME),
+                ))
+                pipeline_runner.convert.assert_called_with(
+                    content=DOCX_CONTENT, filename=DOCX_FILENAME, data_type=MimeTypes.DOCX,
+                    includes=None,
+                    context=ANY
+                )
+                assert response.status_code == 200
+
+        def test_should_reject_empty_file(self, config, args):
+            with _api_test_client(config, args) as test_client:
+                response = test_client.post('/convert', data=dict(
+                    file=(BytesIO(b''), PDF_FILENAME),
+                ))
+                assert response.status_code == BadRequest.code
+
         def test_should_accept_post_data_and_pass_to_convert_method(
                 self, config, args, pipeline_runner):
 
@@ -183,7 +223,7 @@ class TestApiBlueprint:
                     data=PDF_CONTENT,
                     content_type=MimeTypes.PDF
                 )
-                expected_context = {'request_args': {}}
+                expected_context = {'request_args': {}, 'requests_session': ANY}
                 pipeline_runner.convert.assert_called_with(
                     content=PDF_CONTENT,
                     filename='%s.pdf' % DEFAULT_FILENAME,
@@ -194,6 +234,22 @@ class TestApiBlueprint:
                 assert response.status_code == 200
                 assert response.data == XML_CONTENT
 
+        def test_should_pass_same_requests_session_to_convert_method(
+                self, config, args, pipeline_runner):
+
+            with _api_test_client(config, args) as test_client:
+                pipeline_runner.convert.return_value = {
+                    'content': XML_CONTENT,
+                    'type': MimeTypes.JATS_XML
+                }
+                sessions = []
+                for _ in range(2):
+                    test_client.post('/convert', data=PDF_CONTENT, content_type=MimeTypes.PDF)
+                    actual_context = pipeline_runner.convert.call_args[1]['context']
+                    sessions.append(actual_context['requests_session'])
+                assert isinstance(sessions[0], requests.Session)
+                assert sessions[1] is sessions[0]
+
         def test_should_pass_includes_parameter_to_convert_method(
                 self, config, args, pipeline_runner: MagicMock):
 
@@ -1,4 +1,6 @@
-from mock import patch, ANY
+from io import BytesIO
+
+from mock import patch, MagicMock, ANY
 
 import pytest
 
@@ -69,3 +71,23 @@ class TestCreateGrobidService:
                 'consolidateCitations': '0'
             }
         )
+
+    def test_should_pass_file_like_content_as_file(self, requests_post):
+        pdf_stream = BytesIO(PDF_CONTENT_1)
+        create_grobid_service(BASE_URL, PATH_1, start_service=False)(
+            (FILENAME_1, pdf_stream)
+        )
+        kwargs = requests_post.call_args[1]
+        assert kwargs['files']['input'][1] == pdf_stream
+
+    def test_should_use_passed_in_session(self, requests_post):
+        session = MagicMock(name='session')
+        create_grobid_service(BASE_URL, PATH_1, start_service=False)(
+            (FILENAME_1, PDF_CONTENT_1), session=session
+        )
+        requests_post.assert_not_called()
+        session.post.assert_called_with(
+            BASE_URL + PATH_1,
+            files=ANY,
+            data=ANY
+        )
@@ -0,0 +1,102 @@
+import pickle
+
+import pytest
+
+from lxml import etree
+
+from sciencebeam.transformers import xslt as xslt_module
+from sciencebeam.transformers.xslt import (
+    xslt_transformer_from_file,
+    xslt_transformer_from_string
+)
+
+
+XSLT_TEMPLATE = b'''<xsl:stylesheet version="1.0"
+    xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+  <xsl:template match="/">
+    <output><xsl:value-of select="/input" /></output>
+  </xsl:template>
+</xsl:stylesheet>'''
+
+MAIN_XSLT_TEMPLATE_WITH_INCLUDE = b'''<xsl:stylesheet version="1.0"
+    xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+  <xsl:include href="common.xsl" />
+  <xsl:template match="/">
+    <output><xsl:call-template name="included" /></output>
+  </xsl:template>
+</xsl:stylesheet>'''
+
+COMMON_XSLT_TEMPLATE = b'''<xsl:stylesheet version="1.0"
+    xmlns:xsl="http://www.w3.org/1999/XSL/Transform">
+  <xsl:template name="included">included</xsl:template>
+</xsl:stylesheet>'''
+
+VALUE_1 = 'value 1'
+
+
+def _get_output_value(result):
+    return etree.fromstring(result).text
+
+
+class TestXsltTransformerFromString:
+    def test_should_transform_xml_string(self):
+        transformer = xslt_transformer_from_string(XSLT_TEMPLATE)
+        result = transformer('<input>%s</input>' % VALUE_1)
+        assert _get_output_value(result) == VALUE_1
+
+    def test_should_return_dom_if_not_to_string(self):
+        transformer = xslt_transformer_from_string(XSLT_TEMPLATE, to_string=False)
+        result = transformer('<input>%s</input>' % VALUE_1)
+        assert result.getroot().text == VALUE_1
+
+    def test_should_transform_after_pickling(self):
+        transformer = pickle.loads(pickle.dumps(
+            xslt_transformer_from_string(XSLT_TEMPLATE)
+        ))
+        result = transformer('<input>%s</input>' % VALUE_1)
+        assert _get_output_value(result) == VALUE_1
+
+    def test_should_accept_parsed_stylesheet_and_transform_after_pickling(self):
+        transformer = pickle.loads(pickle.dumps(
+            xslt_transformer_from_string(etree.fromstring(XSLT_TEMPLATE))
+        ))
+        result = transformer('<input>%s</input>' % VALUE_1)
+        assert _get_output_value(result) == VALUE_1
+
+    def test_should_compile_same_stylesheet_only_once(self, monkeypatch):
+        monkeypatch.setattr(xslt_module, '_COMPILED_XSLT_BY_HASH', {})
+        transformers = [
+            xslt_transformer_from_string(XSLT_TEMPLATE),
+            xslt_transformer_from_string(XSLT_TEMPLATE.decode('utf-8')),
+            pickle.loads(pickle.dumps(xslt_transformer_from_string(XSLT_TEMPLATE)))
+        ]
+        transforms = [
+            transformer._get_transform()  # pylint: disable=protected-access
+            for transformer in transformers
+        ]
+        assert transforms[1] is transforms[0]
+        assert transforms[2] is transforms[0]
+
+
+class TestXsltTransformerFromFile:
+    def test_should_resolve_relative_include_after_pickling(self, temp_dir, monkeypatch):
+        temp_dir.joinpath('main.xsl').write_bytes(MAIN_XSLT_TEMPLATE_WITH_INCLUDE)
+        temp_dir.joinpath('common.xsl').write_bytes(COMMON_XSLT_TEMPLATE)
+        transformer = xslt_transformer_from_file(str(temp_dir.joinpath('main.xsl')))
+        assert _get_output_value(transformer('<input />')) == 'included'
+        monkeypatch.setattr(xslt_module, '_COMPILED_XSLT_BY_HASH', {})
+        transformer = pickle.loads(pickle.dumps(transformer))
+        assert _get_output_value(transformer('<input />')) == 'included'
+
+    def test_should_not_share_compiled_stylesheet_with_different_base_url(
+            self, temp_dir, monkeypatch):
+        monkeypatch.setattr(xslt_module, '_COMPILED_XSLT_BY_HASH', {})
+        temp_dir.joinpath('main.xsl').write_bytes(MAIN_XSLT_TEMPLATE_WITH_INCLUDE)
+        temp_dir.joinpath('common.xsl').write_bytes(COMMON_XSLT_TEMPLATE)
+        transformer = xslt_transformer_from_file(str(temp_dir.joinpath('main.xsl')))
+        # a base-less copy with the same content must not reuse the based compile
+        # (nor must its failure to resolve affect the file based transformer)
+        with pytest.raises(etree.XSLTParseError):
+            xslt_transformer_from_string(transformer.xslt_template)
+        transformer = pickle.loads(pickle.dumps(transformer))
+        assert _get_output_value(transformer('<input />')) == 'included'